@@ -6,10 +6,13 @@ BM25 keyword search + FastEmbed reranking (lightweight ONNX-based)
 import os
 import sys
 import json
-import pickle
 import hashlib
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 
@@ -66,7 +69,7 @@ os.makedirs(os.environ["FASTEMBED_CACHE_PATH"], exist_ok=True)
 
 def _compute_pdf_dir_hash(pdf_dir: Path) -> str:
     """Compute a stable hash of PDF files (name, size, mtime)."""
-    h = hashlib.sha1()
+    h = hashlib.blake2b(digest_size=16)
     pdf_files = sorted(p for p in pdf_dir.glob("*.pdf"))
     for p in pdf_files:
         try:
@@ -90,14 +93,30 @@ def _default_index_cache_dir() -> Path:
     return Path(home) / ".cache" / "Locus" / "index_cache"
 
 
+# Bump when the on-disk index format changes so stale caches are rebuilt.
+_INDEX_CACHE_VERSION = 3
+
+
 def _index_cache_prefix(pdf_dir: Path, ocr_mode: str, ocr_dpi: int) -> str:
     """Stable prefix for cache files per folder + OCR settings."""
     folder_hash = _compute_pdf_dir_hash(pdf_dir)
     return f"locator_{folder_hash}_{ocr_mode}_dpi{ocr_dpi}"
 
+
+def _embedding_cache_path(pdf_dir: Path, model_name: str) -> Path:
+    """Embedding cache path (without suffix) per folder + model.
+
+    Keyed by the folder path rather than its contents: entries are matched by
+    passage hash, so unchanged pages are reused after PDFs are edited. The
+    cache is two files: `.npy` holds the int8 rows (memory-mapped on load)
+    and `.npz` the passage hashes and row scales.
+    """
+    folder_key = hashlib.blake2b(str(pdf_dir.resolve()).encode("utf-8"), digest_size=16).hexdigest()
+    model_slug = model_name.replace("/", "_")
+    return _default_index_cache_dir() / f"embeddings_{folder_key}_{model_slug}"
+
 import fitz  # PyMuPDF
 import numpy as np
-from rank_bm25 import BM25Okapi
 import re
 
 def _default_ocr_cache_dir() -> str:
@@ -110,6 +129,30 @@ def _default_ocr_cache_dir() -> str:
         return os.path.join(home, "Library", "Caches", "Locus", "ocr_cache")
     return os.path.join(home, ".cache", "Locus", "ocr_cache")
 
+def _create_rapidocr():
+    """Create a RapidOCR engine using all CPU cores for ONNX inference."""
+    from rapidocr_onnxruntime import RapidOCR
+    threads = os.cpu_count() or 1
+    try:
+        return RapidOCR(intra_op_num_threads=threads)
+    except TypeError:
+        # Older releases don't accept session options as kwargs
+        return RapidOCR()
+
+
+# Loading the ONNX detection/recognition sessions is expensive, so one
+# engine is shared by every OCRProcessor in the process.
+_rapidocr_engine = None
+
+
+def _get_rapidocr():
+    """Return the shared RapidOCR engine, creating it on first use."""
+    global _rapidocr_engine
+    if _rapidocr_engine is None:
+        _rapidocr_engine = _create_rapidocr()
+    return _rapidocr_engine
+
+
 class OCRProcessor:
     """Optional OCR processor with disk cache."""
 
@@ -118,8 +161,7 @@ class OCRProcessor:
         os.makedirs(self.cache_dir, exist_ok=True)
         self._mem_cache: dict[str, str] = {}
         try:
-            from rapidocr_onnxruntime import RapidOCR
-            self._ocr = RapidOCR()
+            self._ocr = _get_rapidocr()
             self.available = True
             self._err = None
         except Exception as e:
@@ -192,19 +234,19 @@ class OCRProcessor:
         return text
 
 
-
-@dataclass
+@dataclass(slots=True)
 class PageDocument:
     """Represents a single page from a PDF."""
     pdf_name: str
     page_num: int  # 1-indexed for user display
     text: str
     chunk_id: int = 0
-    tokens: list = field(default_factory=list)
+    # Index tokens, only held until the BM25 index is built; None = derive from text
+    tokens: Optional[list] = None
     
-    def __post_init__(self):
-        if not self.tokens:
-            self.tokens = tokenize(self.text)
+    def get_tokens(self) -> list[str]:
+        """Index tokens, tokenizing the text if they weren't supplied."""
+        return self.tokens if self.tokens is not None else tokenize(self.text)
     
     @property
     def doc_id(self) -> str:
@@ -213,42 +255,162 @@ class PageDocument:
         return f"{self.pdf_name}::page_{self.page_num}"
 
 
+_EN_TOKEN_RE = re.compile(r'\b[a-z0-9]+\b')
+_CJK_CHAR_RE = re.compile(r'[\u4e00-\u9fff]')
+
+# English stopwords (removed from tokens)
+_STOPWORDS = frozenset({
+    'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been',
+    'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
+    'would', 'could', 'should', 'may', 'might', 'must', 'shall',
+    'can', 'need', 'dare', 'ought', 'used', 'to', 'of', 'in',
+    'for', 'on', 'with', 'at', 'by', 'from', 'as', 'into', 'through',
+    'during', 'before', 'after', 'above', 'below', 'between', 'under',
+    'again', 'further', 'then', 'once', 'here', 'there', 'when',
+    'where', 'why', 'how', 'all', 'each', 'few', 'more', 'most',
+    'other', 'some', 'such', 'no', 'nor', 'not', 'only', 'own',
+    'same', 'so', 'than', 'too', 'very', 'just', 'and', 'but',
+    'if', 'or', 'because', 'until', 'while', 'this', 'that', 'these',
+    'those', 'it', 'its',
+})
+
+
 def tokenize(text: str) -> list[str]:
     """Tokenization supporting English and Chinese."""
     text = text.lower()
     
-    # Extract English words
-    english_tokens = re.findall(r'\b[a-z0-9]+\b', text)
-    
-    # Extract Chinese characters (each character is a token)
-    chinese_tokens = re.findall(r'[\u4e00-\u9fff]', text)
+    # English words, minus single characters and stopwords
+    english_tokens = [t for t in _EN_TOKEN_RE.findall(text)
+                      if len(t) > 1 and t not in _STOPWORDS]
     
-    # Combine tokens
-    tokens = english_tokens + chinese_tokens
+    # Chinese characters (each character is a token)
+    chinese_tokens = _CJK_CHAR_RE.findall(text)
     
-    # Remove English stopwords
-    stopwords = {'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been', 
-                 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
-                 'would', 'could', 'should', 'may', 'might', 'must', 'shall',
-                 'can', 'need', 'dare', 'ought', 'used', 'to', 'of', 'in',
-                 'for', 'on', 'with', 'at', 'by', 'from', 'as', 'into', 'through',
-                 'during', 'before', 'after', 'above', 'below', 'between', 'under',
-                 'again', 'further', 'then', 'once', 'here', 'there', 'when',
-                 'where', 'why', 'how', 'all', 'each', 'few', 'more', 'most',
-                 'other', 'some', 'such', 'no', 'nor', 'not', 'only', 'own',
-                 'same', 'so', 'than', 'too', 'very', 'just', 'and', 'but',
-                 'if', 'or', 'because', 'until', 'while', 'this', 'that', 'these',
-                 'those', 'it', 'its'}
-    def _is_cjk_char(tok: str) -> bool:
-        return len(tok) == 1 and '\u4e00' <= tok <= '\u9fff'
+    return english_tokens + chinese_tokens
+
+
+@lru_cache(maxsize=1024)
+def _tokenize_query(query: str) -> tuple[str, ...]:
+    """Cached tokenize() for queries, which are re-tokenized at several stages."""
+    return tuple(tokenize(query))
+
+
+def _pack_strings(strings: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    """Pack strings into one UTF-8 byte array plus start/end offsets."""
+    encoded = [s.encode("utf-8") for s in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    blob = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    return blob, offsets
+
+
+def _unpack_strings(blob: np.ndarray, offsets: np.ndarray) -> list[str]:
+    """Inverse of _pack_strings."""
+    data = blob.tobytes()
+    bounds = offsets.tolist()
+    return [data[bounds[i]:bounds[i + 1]].decode("utf-8") for i in range(len(bounds) - 1)]
+
+
+def _save_documents(path: Path, documents: list[PageDocument]) -> None:
+    """Write documents to a columnar .npz cache (no pickled objects)."""
+    pdf_names = sorted({d.pdf_name for d in documents})
+    name_ids = {name: i for i, name in enumerate(pdf_names)}
+    names_blob, names_offsets = _pack_strings(pdf_names)
+    text_blob, text_offsets = _pack_strings([d.text for d in documents])
+    # Tokens never contain whitespace, so one space-joined string per document
+    tokens_blob, tokens_offsets = _pack_strings([" ".join(d.get_tokens()) for d in documents])
+    with open(path, "wb") as f:
+        np.savez(
+            f,
+            names_blob=names_blob,
+            names_offsets=names_offsets,
+            pdf_ids=np.array([name_ids[d.pdf_name] for d in documents], dtype=np.int32),
+            page_nums=np.array([d.page_num for d in documents], dtype=np.int32),
+            chunk_ids=np.array([d.chunk_id for d in documents], dtype=np.int32),
+            text_blob=text_blob,
+            text_offsets=text_offsets,
+            tokens_blob=tokens_blob,
+            tokens_offsets=tokens_offsets,
+        )
+
 
-    return [t for t in tokens if (len(t) > 1 or _is_cjk_char(t)) and t not in stopwords]
+def _load_documents(path: Path) -> list[PageDocument]:
+    """Read documents written by _save_documents."""
+    with np.load(path, allow_pickle=False) as data:
+        pdf_names = _unpack_strings(data["names_blob"], data["names_offsets"])
+        texts = _unpack_strings(data["text_blob"], data["text_offsets"])
+        tokens = _unpack_strings(data["tokens_blob"], data["tokens_offsets"])
+        pdf_ids = data["pdf_ids"].tolist()
+        page_nums = data["page_nums"].tolist()
+        chunk_ids = data["chunk_ids"].tolist()
+    return [
+        PageDocument(pdf_name=pdf_names[pdf_ids[i]], page_num=page_nums[i], text=texts[i],
+                     chunk_id=chunk_ids[i], tokens=tokens[i].split())
+        for i in range(len(texts))
+    ]
+
+
+# Chunking splits: blank-line paragraphs, then sentence-ending punctuation
+_PARA_SPLIT_RE = re.compile(r"\n\s*\n")
+_SENT_SPLIT_RE = re.compile(r"(?<=[\.\?\!。！？])\s+")
+
+
+def _load_embedding_cache(path: Path) -> tuple[list[str], Optional[np.ndarray], Optional[np.ndarray]]:
+    """Read (passage hashes, int8 rows, scales); ([], None, None) if missing or unreadable.
+
+    Rows are memory-mapped read-only, so only the pages actually touched are
+    read from disk.
+    """
+    try:
+        with np.load(f"{path}.npz", allow_pickle=False) as data:
+            keys = data["keys"].tolist()
+            scales = data["scales"]
+        rows = np.load(f"{path}.npy", mmap_mode="r", allow_pickle=False)
+    except Exception:
+        return [], None, None
+    if rows.ndim != 2 or len(rows) != len(keys) or len(scales) != len(keys):
+        return [], None, None
+    return keys, rows, scales
+
+
+def _save_embedding_cache(path: Path, keys: list[str], rows: np.ndarray,
+                          scales: np.ndarray) -> None:
+    """Write rows (.npy) and hashes/scales (.npz) so they are only ever replaced together.
+
+    Both files are written to temporary names first. If either write or the
+    swap fails, the cache is removed rather than left pairing old hashes
+    with new rows.
+    """
+    rows_path, meta_path = f"{path}.npy", f"{path}.npz"
+    tmp_paths = [f"{rows_path}.tmp", f"{meta_path}.tmp"]
+    try:
+        with open(tmp_paths[0], "wb") as f:
+            np.save(f, rows)
+        with open(tmp_paths[1], "wb") as f:
+            np.savez(f, keys=np.array(keys, dtype="<U32"), scales=scales)
+        os.replace(tmp_paths[0], rows_path)
+        try:
+            os.replace(tmp_paths[1], meta_path)
+        except OSError:
+            # The new rows are already in place; drop both rather than keep old hashes
+            tmp_paths += [meta_path, rows_path]
+            raise
+    except OSError:
+        for stale in tmp_paths:
+            try:
+                os.remove(stale)
+            except OSError:
+                pass
 
 
 class PDFIndexer:
     """Extracts and indexes text from PDFs."""
     _MAX_TOKENS = 400
     _OVERLAP_TOKENS = 80
+    # Below this many PDFs, starting worker processes costs more than it saves
+    _PARALLEL_MIN_PDFS = 4
+    # "blocks" output with image blocks (block_type 1) kept alongside text
+    _BLOCK_FLAGS = fitz.TEXTFLAGS_BLOCKS | fitz.TEXT_PRESERVE_IMAGES
 
     def __init__(self, pdf_dir: str, ocr_mode: str = "fast", ocr_progress_callback=None,
                  ocr_dpi: int = 200, cancel_event=None):
@@ -267,13 +429,14 @@ class PDFIndexer:
 
     def _pdf_cache_key(self, pdf_path: Path, page_num: int) -> str:
         base = f"{pdf_path.resolve()}::{pdf_path.stat().st_mtime}::{page_num}::{self.ocr_dpi}"
-        return hashlib.sha1(base.encode("utf-8")).hexdigest()
+        return hashlib.blake2b(base.encode("utf-8"), digest_size=16).hexdigest()
 
-    def _split_units(self, text: str) -> list[str]:
-        paragraphs = [p.strip() for p in re.split(r"\n\s*\n", text) if p.strip()]
+    @staticmethod
+    def _split_units(text: str) -> list[str]:
+        paragraphs = [p.strip() for p in _PARA_SPLIT_RE.split(text) if p.strip()]
         units: list[str] = []
         for p in paragraphs:
-            parts = re.split(r"(?<=[\.\?\!。！？])\s+", p)
+            parts = _SENT_SPLIT_RE.split(p)
             if len(parts) == 1:
                 lines = [l.strip() for l in p.splitlines() if l.strip()]
                 units.extend(lines if lines else [p.strip()])
@@ -281,33 +444,46 @@ class PDFIndexer:
                 units.extend([s.strip() for s in parts if s.strip()])
         return units
 
-    def _chunk_text(self, text: str) -> list[str]:
-        units = self._split_units(text)
+    @staticmethod
+    def _join_window(window: deque[tuple[str, list[str], int]]) -> tuple[str, list[str]]:
+        text = " ".join(u for u, _, _ in window).strip()
+        tokens = [tok for _, unit_tokens, _ in window for tok in unit_tokens]
+        return text, tokens
+
+    @classmethod
+    def _chunk_text(cls, text: str) -> list[tuple[str, list[str]]]:
+        """Split text into overlapping (chunk_text, chunk_tokens) pairs.
+
+        Units are tokenized once; a chunk's tokens are the concatenation of
+        its units' tokens, so chunks never need to be re-tokenized.
+        """
+        units = cls._split_units(text)
         if not units:
             return []
 
-        chunks: list[str] = []
-        window: list[tuple[str, int]] = []
+        chunks: list[tuple[str, list[str]]] = []
+        window: deque[tuple[str, list[str], int]] = deque()
         total_tokens = 0
 
         for unit in units:
-            tok_count = len(tokenize(unit))
+            unit_tokens = tokenize(unit)
+            tok_count = len(unit_tokens)
             if tok_count == 0:
                 tok_count = 1
 
-            if total_tokens + tok_count > self._MAX_TOKENS and window:
-                chunks.append(" ".join(u for u, _ in window).strip())
-                while window and total_tokens > self._OVERLAP_TOKENS:
-                    _, t = window.pop(0)
+            if total_tokens + tok_count > cls._MAX_TOKENS and window:
+                chunks.append(cls._join_window(window))
+                while window and total_tokens > cls._OVERLAP_TOKENS:
+                    _, _, t = window.popleft()
                     total_tokens -= t
 
-            window.append((unit, tok_count))
+            window.append((unit, unit_tokens, tok_count))
             total_tokens += tok_count
 
         if window:
-            chunks.append(" ".join(u for u, _ in window).strip())
+            chunks.append(cls._join_window(window))
 
-        return [c for c in chunks if c]
+        return [(c, toks) for c, toks in chunks if c]
         
     def extract_all(self) -> list[PageDocument]:
         """Extract text from all PDFs in directory."""
@@ -316,62 +492,207 @@ class PDFIndexer:
         pdf_files = list(self.pdf_dir.glob("*.pdf"))
         print(f"Found {len(pdf_files)} PDF files")
         
-        for pdf_path in pdf_files:
-            if self.cancel_event is not None and self.cancel_event.is_set():
-                break
-            print(f"  Processing: {pdf_path.name}")
-            self._extract_pdf(pdf_path)
+        ocr_enabled = self.ocr is not None and self.ocr.available
+        workers = min(len(pdf_files), os.cpu_count() or 1)
+        if len(pdf_files) >= self._PARALLEL_MIN_PDFS and workers > 1:
+            self._extract_parallel(pdf_files, ocr_enabled, workers)
+        else:
+            for pdf_path in pdf_files:
+                if self._cancelled():
+                    break
+                print(f"  Processing: {pdf_path.name}")
+                self._add_pages(pdf_path, *self._extract_text_pages(pdf_path, self.ocr_mode, ocr_enabled))
         
         print(f"Total pages indexed: {len(self.documents)}")
         return self.documents
     
-    def _extract_pdf(self, pdf_path: Path):
-        """Extract text from a single PDF."""
-        try:
-            doc = fitz.open(pdf_path)
-            total_pages = len(doc)
-            for page_num in range(total_pages):
-                if self.cancel_event is not None and self.cancel_event.is_set():
+    def _extract_parallel(self, pdf_files: list[Path], ocr_enabled: bool, workers: int):
+        """Extract the text layer of each PDF in a worker process.
+        
+        OCR still runs here, on the shared engine, for the pages the workers
+        flag; results are consumed in file order so the index is unchanged.
+        """
+        # spawn, not fork: the caller (the GUI) already runs Tk and ONNX
+        # threads, and forking a multithreaded process can inherit held locks
+        with ProcessPoolExecutor(max_workers=workers,
+                                 mp_context=multiprocessing.get_context("spawn")) as pool:
+            futures = [pool.submit(self._extract_text_pages, pdf_path, self.ocr_mode, ocr_enabled)
+                       for pdf_path in pdf_files]
+            for pdf_path, future in zip(pdf_files, futures):
+                if self._cancelled():
+                    # Drop queued extractions so leaving the with block only
+                    # waits for the ones already running
+                    pool.shutdown(cancel_futures=True)
                     break
-                page = doc[page_num]
-                text = page.get_text()
-                ocr_text = ""
-                has_images = bool(page.get_images(full=True))
-                cache_key = self._pdf_cache_key(pdf_path, page_num)
-
-                if self.ocr_mode == "deep":
-                    if has_images and self.ocr and self.ocr.available:
-                        if self.ocr_progress_callback:
-                            self.ocr_progress_callback(pdf_path.name, page_num + 1, total_pages)
-                        ocr_text = self.ocr.ocr_page(cache_key, page, self.ocr_dpi)
-                elif self.ocr_mode == "fast":
-                    if has_images and len(text.strip()) < 20 and self.ocr and self.ocr.available:
-                        if self.ocr_progress_callback:
-                            self.ocr_progress_callback(pdf_path.name, page_num + 1, total_pages)
-                        ocr_text = self.ocr.ocr_page(cache_key, page, self.ocr_dpi)
-
-                if ocr_text:
-                    text = f"{text}\n{ocr_text}".strip()
-
-                # Skip nearly empty pages
-                min_chars = 10 if ocr_text else 50
-                if len(text.strip()) < min_chars:
-                    continue
-
-                chunks = self._chunk_text(text)
-                if not chunks:
-                    continue
-
-                for idx, chunk_text in enumerate(chunks, 1):
+                print(f"  Processing: {pdf_path.name}")
+                try:
+                    result = future.result()
+                except Exception:
+                    # Worker process died or couldn't start; extract in-process instead
+                    result = self._extract_text_pages(pdf_path, self.ocr_mode, ocr_enabled)
+                self._add_pages(pdf_path, *result)
+    
+    def _cancelled(self) -> bool:
+        return self.cancel_event is not None and self.cancel_event.is_set()
+    
+    @classmethod
+    def _extract_text_pages(cls, pdf_path: Path, ocr_mode: str, ocr_enabled: bool):
+        """Read and chunk the text layer of one PDF (runs in worker processes).
+        
+        Returns (pages, total_pages, error). Each page is (page_num, text,
+        chunks), with chunks None when the page still needs OCR.
+        """
+        pages: list[tuple[int, str, Optional[list[tuple[str, list[str]]]]]] = []
+        total_pages = 0
+        try:
+            with fitz.open(pdf_path) as doc:
+                total_pages = len(doc)
+                for page_num in range(total_pages):
+                    page = doc[page_num]
+                    # One extraction pass yields both the text and whether images are drawn
+                    blocks = page.get_text("blocks", flags=cls._BLOCK_FLAGS)
+                    text = "".join(b[4] for b in blocks if b[6] == 0)
+                    has_images = any(b[6] == 1 for b in blocks)
+                    
+                    if ocr_mode == "deep":
+                        needs_ocr = has_images and ocr_enabled
+                    elif ocr_mode == "fast":
+                        needs_ocr = has_images and len(text.strip()) < 20 and ocr_enabled
+                    else:
+                        needs_ocr = False
+                    
+                    chunks = None if needs_ocr else cls._page_chunks(text, "")
+                    if chunks is None or chunks:
+                        pages.append((page_num, text, chunks))
+        except Exception as e:
+            return pages, total_pages, str(e)
+        return pages, total_pages, None
+    
+    @classmethod
+    def _page_chunks(cls, text: str, ocr_text: str) -> list[tuple[str, list[str]]]:
+        """Chunks for one page, or [] for nearly empty pages."""
+        if ocr_text:
+            text = f"{text}\n{ocr_text}".strip()
+        
+        # Skip nearly empty pages
+        min_chars = 10 if ocr_text else 50
+        if len(text.strip()) < min_chars:
+            return []
+        return cls._chunk_text(text)
+    
+    def _add_pages(self, pdf_path: Path, pages, total_pages: int, error: Optional[str]):
+        """OCR the pages that need it and append every chunk as a PageDocument."""
+        doc = None
+        try:
+            for page_num, text, chunks in pages:
+                if chunks is None:
+                    if self._cancelled():
+                        break
+                    if doc is None:
+                        doc = fitz.open(pdf_path)
+                    if self.ocr_progress_callback:
+                        self.ocr_progress_callback(pdf_path.name, page_num + 1, total_pages)
+                    cache_key = self._pdf_cache_key(pdf_path, page_num)
+                    ocr_text = self.ocr.ocr_page(cache_key, doc[page_num], self.ocr_dpi)
+                    chunks = self._page_chunks(text, ocr_text)
+                
+                for idx, (chunk_text, chunk_tokens) in enumerate(chunks, 1):
                     self.documents.append(PageDocument(
                         pdf_name=pdf_path.name,
                         page_num=page_num + 1,  # 1-indexed
                         text=chunk_text,
-                        chunk_id=idx
+                        chunk_id=idx,
+                        tokens=chunk_tokens
                     ))
-            doc.close()
         except Exception as e:
-            print(f"    Error processing {pdf_path.name}: {e}")
+            error = error or str(e)
+        finally:
+            if doc is not None:
+                doc.close()
+        if error:
+            print(f"    Error processing {pdf_path.name}: {error}")
+
+
+class BM25Index:
+    """Okapi BM25 scored with NumPy over an inverted index.
+
+    Scores match rank_bm25's BM25Okapi (same k1, b and epsilon floor for
+    negative IDF), but each query term only touches its own posting list
+    instead of looping over every document in Python.
+    """
+    
+    def __init__(self, corpus: list[list[str]], k1: float = 1.5, b: float = 0.75,
+                 epsilon: float = 0.25):
+        self.k1 = k1
+        self.b = b
+        self.corpus_size = len(corpus)
+        self.doc_len = np.array([len(tokens) for tokens in corpus], dtype=float)
+        total_len = self.doc_len.sum()
+        self.avgdl = total_len / self.corpus_size if total_len else 1.0
+        
+        # Terms become int32 ids in first-seen order. Postings are stored
+        # CSR-style: term t occurs in post_docs[post_ptr[t]:post_ptr[t + 1]],
+        # with matching frequencies in post_tf.
+        self.vocab: dict[str, int] = {}
+        term_ids = np.fromiter(
+            (self.vocab.setdefault(term, len(self.vocab)) for tokens in corpus for term in tokens),
+            dtype=np.int64, count=int(total_len))
+        doc_ids = np.repeat(np.arange(self.corpus_size, dtype=np.int64), self.doc_len.astype(np.int64))
+        # One sort groups (term, doc) pairs: by term, then by document
+        stride = max(self.corpus_size, 1)
+        pairs, tf = np.unique(term_ids * stride + doc_ids, return_counts=True)
+        self.post_docs = (pairs % stride).astype(np.int32)
+        self.post_tf = tf.astype(float)
+        df = np.bincount(pairs // stride, minlength=len(self.vocab))
+        self.post_ptr = np.concatenate(([0], np.cumsum(df)))
+        
+        # Terms in more than half the documents get negative IDF; floor them
+        # at epsilon * average IDF like BM25Okapi does.
+        df = df.astype(float)
+        idf = np.log(self.corpus_size - df + 0.5) - np.log(df + 0.5)
+        if idf.size:
+            idf[idf < 0] = epsilon * idf.mean()
+        self.idf = idf
+        
+        # Per-document length normalization term of the BM25 denominator
+        self._len_norm = self.k1 * (1 - self.b + self.b * self.doc_len / self.avgdl)
+    
+    def _term_contributions(self, query_tokens: list[str]):
+        """Yield (doc ids, BM25 contributions) for each query term in the vocabulary."""
+        for term in query_tokens:
+            term_id = self.vocab.get(term)
+            if term_id is None:
+                continue
+            lo, hi = self.post_ptr[term_id], self.post_ptr[term_id + 1]
+            doc_ids = self.post_docs[lo:hi]
+            tf = self.post_tf[lo:hi]
+            yield doc_ids, self.idf[term_id] * (tf * (self.k1 + 1) /
+                                                (tf + self._len_norm[doc_ids]))
+    
+    def get_scores(self, query_tokens: list[str]) -> np.ndarray:
+        """BM25 score of every document for the query."""
+        scores = np.zeros(self.corpus_size)
+        for doc_ids, contrib in self._term_contributions(query_tokens):
+            scores[doc_ids] += contrib
+        return scores
+    
+    def get_candidate_scores(self, query_tokens: list[str]) -> tuple[np.ndarray, np.ndarray]:
+        """BM25 scores for only the documents containing a query term.
+        
+        Returns (doc_ids, scores) with doc_ids ascending; every other
+        document scores 0.
+        """
+        doc_id_parts = []
+        contrib_parts = []
+        for doc_ids, contrib in self._term_contributions(query_tokens):
+            doc_id_parts.append(doc_ids)
+            contrib_parts.append(contrib)
+        if not doc_id_parts:
+            return np.empty(0, dtype=np.int32), np.empty(0)
+        candidates, slots = np.unique(np.concatenate(doc_id_parts), return_inverse=True)
+        scores = np.bincount(slots, weights=np.concatenate(contrib_parts),
+                             minlength=len(candidates))
+        return candidates, scores
 
 
 class BM25Retriever:
@@ -379,23 +700,31 @@ class BM25Retriever:
     
     def __init__(self, documents: list[PageDocument]):
         self.documents = documents
-        self.corpus = [doc.tokens for doc in documents]
-        self.bm25 = BM25Okapi(self.corpus)
+        self.bm25 = BM25Index([doc.get_tokens() for doc in documents])
+        # The index holds everything searches need; drop the per-document
+        # token lists, which otherwise cost several times the page text.
+        for doc in documents:
+            doc.tokens = None
     
-    def search(self, query: str, top_k: int = 20) -> list[tuple[PageDocument, float]]:
-        """Return top-k documents with BM25 scores."""
-        query_tokens = tokenize(query)
-        scores = self.bm25.get_scores(query_tokens)
+    def search_indices(self, query: str, top_k: int = 20) -> list[tuple[int, float]]:
+        """Return top-k (document index, BM25 score) pairs."""
+        query_tokens = _tokenize_query(query)
+        # Documents without any query term score 0, so rank only the candidates
+        doc_ids, scores = self.bm25.get_candidate_scores(query_tokens)
         
         # Get top-k indices
-        top_indices = np.argsort(scores)[::-1][:top_k]
+        top_indices = _top_k_desc(scores, top_k)
         
         results = []
         for idx in top_indices:
             if scores[idx] > 0:  # Only include docs with non-zero scores
-                results.append((self.documents[idx], scores[idx]))
+                results.append((int(doc_ids[idx]), scores[idx]))
         
         return results
+    
+    def search(self, query: str, top_k: int = 20) -> list[tuple[PageDocument, float]]:
+        """Return top-k documents with BM25 scores."""
+        return [(self.documents[idx], score) for idx, score in self.search_indices(query, top_k)]
 
 
 # Model name mapping: GUI names -> FastEmbed model names
@@ -412,12 +741,49 @@ MODEL_NAME_MAP = {
 }
 
 
-def cosine_similarity(a: np.ndarray, b: np.ndarray) -> np.ndarray:
-    """Compute cosine similarity between query vector and document vectors."""
-    # Normalize vectors
-    a_norm = a / np.linalg.norm(a)
-    b_norm = b / np.linalg.norm(b, axis=1, keepdims=True)
-    return np.dot(b_norm, a_norm)
+def _normalize_rows(x: np.ndarray) -> np.ndarray:
+    """Scale rows to unit length in place (all-zero rows are left as is)."""
+    norms = np.linalg.norm(x, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    x /= norms
+    return x
+
+
+def _quantize_rows(x: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Symmetric per-row int8 quantization, x ~= q * scales[:, None]."""
+    scales = (np.abs(x).max(axis=1) / 127.0).astype(np.float32)
+    scales[scales == 0] = 1.0
+    q = np.round(x / scales[:, None]).astype(np.int8)
+    return q, scales
+
+
+def _int8_matvec(rows: np.ndarray, q: np.ndarray, block: int = 256) -> np.ndarray:
+    """rows @ q for int8 rows and an int8 vector, via BLAS sgemv on float32 blocks.
+    
+    NumPy has no BLAS path for integers, so blocks of rows are widened into a
+    small float32 buffer instead. Products are at most 127*127 and, for
+    embedding sizes up to 1040, every partial sum stays below 2**24, so the
+    float32 result equals the exact int32 dot product.
+    """
+    out = np.empty(len(rows), dtype=np.float32)
+    qf = q.astype(np.float32)
+    buf = np.empty((min(block, len(rows)), rows.shape[1]), dtype=np.float32)
+    for start in range(0, len(rows), block):
+        chunk = rows[start:start + block]
+        widened = buf[:len(chunk)]
+        widened[...] = chunk
+        np.dot(widened, qf, out=out[start:start + len(chunk)])
+    return out
+
+
+def _percentiles(scores: np.ndarray, p_low: float, p_high: float) -> tuple[float, float]:
+    """Two percentiles (linear interpolation, as np.percentile) from one partition."""
+    pos = np.array([p_low, p_high]) / 100.0 * (scores.size - 1)
+    lo = np.floor(pos).astype(np.intp)
+    hi = np.ceil(pos).astype(np.intp)
+    part = np.partition(scores, np.unique(np.concatenate([lo, hi])))
+    vals = part[lo] + (part[hi] - part[lo]) * (pos - lo)
+    return float(vals[0]), float(vals[1])
 
 
 def _percentile_normalize(scores: np.ndarray, p_low: float = 5.0, p_high: float = 95.0,
@@ -425,28 +791,68 @@ def _percentile_normalize(scores: np.ndarray, p_low: float = 5.0, p_high: float
     """Robustly normalize scores to [0,1] using percentiles with fallback."""
     if scores.size == 0:
         return scores
+    clip = False
     if scores.size < 20:
-        s_min = float(scores.min())
-        s_max = float(scores.max())
-        denom = s_max - s_min
-        if denom < eps:
-            return np.zeros_like(scores)
-        return (scores - s_min) / denom
-    p5 = float(np.percentile(scores, p_low))
-    p95 = float(np.percentile(scores, p_high))
-    denom = p95 - p5
+        lo, hi = float(scores.min()), float(scores.max())
+    else:
+        lo, hi = _percentiles(scores, p_low, p_high)
+        clip = True
+        if hi - lo < eps:
+            lo, hi = float(scores.min()), float(scores.max())
+            clip = False
+    denom = hi - lo
     if denom < eps:
-        s_min = float(scores.min())
-        s_max = float(scores.max())
-        denom2 = s_max - s_min
-        if denom2 < eps:
-            return np.zeros_like(scores)
-        return (scores - s_min) / denom2
-    return np.clip((scores - p5) / denom, 0.0, 1.0)
+        return np.zeros_like(scores)
+    out = np.subtract(scores, lo)
+    out /= denom
+    if clip:
+        np.clip(out, 0.0, 1.0, out=out)
+    return out
+
+
+def _blend_scores(semantic_scores: np.ndarray, bm25_scores: np.ndarray,
+                  bm25_weight: float) -> np.ndarray:
+    """Percentile-normalize both score vectors and blend them in place."""
+    # A zero-weight side (e.g. BM25 in cross-lingual search) would only add 0s
+    if bm25_weight <= 0:
+        return _percentile_normalize(semantic_scores)
+    if bm25_weight >= 1:
+        return _percentile_normalize(bm25_scores)
+    combined = _percentile_normalize(semantic_scores)
+    bm25_norm = _percentile_normalize(bm25_scores)
+    combined *= 1 - bm25_weight
+    bm25_norm *= bm25_weight
+    combined += bm25_norm
+    return combined
+
+
+def _top_k_desc(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, best first, without a full sort."""
+    n = len(scores)
+    if k <= 0 or n == 0:
+        return np.empty(0, dtype=np.intp)
+    if k < n:
+        idx = np.argpartition(-scores, k - 1)[:k]
+    else:
+        idx = np.arange(n)
+    return idx[np.argsort(-scores[idx], kind="stable")]
+
+
+def _rrf_fuse(semantic_scores: np.ndarray, bm25_scores: np.ndarray,
+              k: float = 60.0) -> np.ndarray:
+    """Reciprocal Rank Fusion: 1/(k + semantic rank) + 1/(k + BM25 rank), with exact ranks."""
+    sem_rank = np.argsort(semantic_scores)[::-1]
+    bm_rank = np.argsort(bm25_scores)[::-1]
+    sem_pos = np.empty_like(sem_rank)
+    bm_pos = np.empty_like(bm_rank)
+    sem_pos[sem_rank] = np.arange(1, len(sem_rank) + 1)
+    bm_pos[bm_rank] = np.arange(1, len(bm_rank) + 1)
+    return (1.0 / (k + sem_pos)) + (1.0 / (k + bm_pos))
 
 
 class SemanticReranker:
     """FastEmbed-based semantic reranking (lightweight ONNX)."""
+    _BATCH_SIZE = 16
     
     def __init__(self, model_name: str = "BAAI/bge-small-en-v1.5"):
         from fastembed import TextEmbedding
@@ -456,6 +862,8 @@ class SemanticReranker:
         # Map model name if needed
         fastembed_name = MODEL_NAME_MAP.get(model_name, model_name)
         cache_dir = os.environ.get("FASTEMBED_CACHE_PATH")
+        # Let ONNX Runtime use every core for the intra-op thread pool
+        threads = os.cpu_count() or 1
         
         # Check if we should use bundled model
         bundled_path = _get_bundled_model_path()
@@ -465,13 +873,15 @@ class SemanticReranker:
             self.model = TextEmbedding(
                 model_name=fastembed_name,
                 cache_dir=cache_dir,
+                threads=threads,
                 local_files_only=False  # Still allow fallback to download
             )
             # Copy bundled model to cache if not already there
             self._ensure_bundled_model_in_cache(bundled_path, cache_dir, fastembed_name)
         else:
             print("(First run downloads the model - please wait...)")
-            self.model = TextEmbedding(model_name=fastembed_name, cache_dir=cache_dir)
+            self.model = TextEmbedding(model_name=fastembed_name, cache_dir=cache_dir,
+                                       threads=threads)
         
         self.model_name = model_name
         
@@ -508,21 +918,33 @@ class SemanticReranker:
         else:
             return f"passage: {text}"
     
-    def encode(self, texts: list[str], is_query: bool = False) -> np.ndarray:
-        """Encode texts to embeddings."""
+    def encode(self, texts: list[str], is_query: bool = False,
+               normalize: bool = False) -> np.ndarray:
+        """Encode texts to embeddings (unit-length rows if `normalize`)."""
         # Add prefixes for BGE models
         prefixed_texts = [self._add_prefix(t, is_query) for t in texts]
+        # Each batch is padded to its longest text, so encode in length order
+        # to keep short passages out of batches with long ones.
+        order = sorted(range(len(prefixed_texts)), key=lambda i: len(prefixed_texts[i]))
+        sorted_texts = [prefixed_texts[i] for i in order]
         # FastEmbed returns a generator, convert to numpy array
-        embeddings = list(self.model.embed(prefixed_texts))
-        return np.array(embeddings)
+        embeddings = np.array(list(self.model.embed(sorted_texts, batch_size=self._BATCH_SIZE)))
+        # Restore the caller's order
+        result = np.empty_like(embeddings)
+        result[order] = embeddings
+        if normalize:
+            _normalize_rows(result)
+        return result
     
-    def encode_single(self, text: str, is_query: bool = False) -> np.ndarray:
+    def encode_single(self, text: str, is_query: bool = False,
+                      normalize: bool = False) -> np.ndarray:
         """Encode a single text to embedding."""
-        return self.encode([text], is_query)[0]
+        return self.encode([text], is_query, normalize)[0]
     
     def rerank(self, query: str, candidates: list[tuple[PageDocument, float]], 
                top_k: int = 5, bm25_weight: float = 0.3,
-               fusion_method: str = "rrf") -> list[tuple[PageDocument, float]]:
+               fusion_method: str = "rrf",
+               candidate_embeddings: Optional[np.ndarray] = None) -> list[tuple[PageDocument, float]]:
         """
         Rerank candidates using semantic similarity.
         
@@ -531,41 +953,37 @@ class SemanticReranker:
             candidates: List of (document, bm25_score) tuples
             top_k: Number of results to return
             bm25_weight: Weight for BM25 score in final ranking (0-1)
+            candidate_embeddings: Optional unit-length passage embeddings,
+                one row per candidate; skips encoding the candidate texts
         """
         if not candidates:
             return []
         
         # Encode query
-        query_embedding = self.encode_single(query, is_query=True)
+        query_embedding = self.encode_single(query, is_query=True, normalize=True)
         
-        # Encode all candidate texts (truncate long pages)
-        texts = [doc.text[:2000] for doc, _ in candidates]
-        doc_embeddings = self.encode(texts, is_query=False)
+        if candidate_embeddings is not None:
+            doc_embeddings = candidate_embeddings
+        else:
+            # Encode all candidate texts (truncate long pages)
+            texts = [doc.text[:2000] for doc, _ in candidates]
+            doc_embeddings = self.encode(texts, is_query=False, normalize=True)
         
-        # Compute semantic similarities
-        semantic_scores = cosine_similarity(query_embedding, doc_embeddings)
+        # Compute semantic similarities (cosine of unit vectors)
+        semantic_scores = doc_embeddings @ query_embedding
         semantic_scores = semantic_scores.astype(float)
 
         bm25_scores = np.array([score for _, score in candidates], dtype=float)
 
         if fusion_method == "rrf":
             # Reciprocal Rank Fusion (RRF)
-            k = 60.0
-            sem_rank = np.argsort(semantic_scores)[::-1]
-            bm_rank = np.argsort(bm25_scores)[::-1]
-            sem_pos = np.empty_like(sem_rank)
-            bm_pos = np.empty_like(bm_rank)
-            sem_pos[sem_rank] = np.arange(1, len(sem_rank) + 1)
-            bm_pos[bm_rank] = np.arange(1, len(bm_rank) + 1)
-            combined_scores = (1.0 / (k + sem_pos)) + (1.0 / (k + bm_pos))
+            combined_scores = _rrf_fuse(semantic_scores, bm25_scores)
         else:
             # Percentile-normalized linear blend
-            semantic_scores = _percentile_normalize(semantic_scores)
-            bm25_scores = _percentile_normalize(bm25_scores)
-            combined_scores = (1 - bm25_weight) * semantic_scores + bm25_weight * bm25_scores
+            combined_scores = _blend_scores(semantic_scores, bm25_scores, bm25_weight)
 
         # Sort by combined score
-        sorted_indices = np.argsort(combined_scores)[::-1][:top_k]
+        sorted_indices = _top_k_desc(combined_scores, top_k)
         
         results = []
         for idx in sorted_indices:
@@ -578,6 +996,12 @@ class SemanticReranker:
 
 class HybridLocator:
     """Main interface combining BM25 + semantic reranking."""
+    # Fast mode keeps BM25's order, without encoding anything, when the top
+    # hit outscores the runner-up by this factor. Only for the percentile
+    # blend with a keyword-heavy weight: RRF ignores score magnitudes, so a
+    # sharp BM25 spread says nothing about the fused order there.
+    _BM25_DOMINANCE_RATIO = 3.0
+    _BM25_DOMINANCE_MIN_WEIGHT = 0.7
     
     def __init__(self, pdf_dir: str, model_name: Optional[str] = "BAAI/bge-small-en-v1.5"):
         self.pdf_dir = Path(pdf_dir)
@@ -586,8 +1010,11 @@ class HybridLocator:
         self.bm25: Optional[BM25Retriever] = None
         self.reranker: Optional[SemanticReranker] = None
         self.documents: list[PageDocument] = []
-        self.doc_embeddings = None  # Pre-computed embeddings
+        self.doc_embeddings = None  # Pre-computed embeddings (int8, unit rows)
+        self.doc_embedding_scales = None  # Per-row dequantization scales
         self.deep_mode = False  # Whether using pre-computed embeddings
+        # Fast mode: passage embeddings by document index, filled on demand
+        self._passage_embeddings: dict[int, np.ndarray] = {}
         
     def build_index(self, force_rebuild: bool = False, ocr_mode: str = "fast",
                     ocr_progress_callback=None, ocr_dpi: int = 200, cancel_event=None):
@@ -597,8 +1024,9 @@ class HybridLocator:
         cache_dir = _default_index_cache_dir()
         cache_dir.mkdir(parents=True, exist_ok=True)
         prefix = _index_cache_prefix(self.pdf_dir, ocr_mode, ocr_dpi)
-        cache_path = cache_dir / f"{prefix}.pkl"
+        cache_path = cache_dir / f"{prefix}.npz"
         meta_path = cache_dir / f"{prefix}.meta.json"
+        self._passage_embeddings = {}
 
         # Try to load from cache
         if not force_rebuild and cache_path.exists():
@@ -609,6 +1037,8 @@ class HybridLocator:
                     meta = json.loads(meta_path.read_text(encoding="utf-8"))
                     if meta.get("dir_hash") != dir_hash:
                         use_cache = False
+                    if meta.get("version") != _INDEX_CACHE_VERSION:
+                        use_cache = False
                 except Exception:
                     use_cache = False
             else:
@@ -618,8 +1048,7 @@ class HybridLocator:
                 print("PDF folder changed, rebuilding index...")
             else:
                 print("Loading index from cache...")
-                with open(cache_path, 'rb') as f:
-                    self.documents = pickle.load(f)
+                self.documents = _load_documents(cache_path)
                 print(f"Loaded {len(self.documents)} pages from cache")
                 # Initialize retrievers
                 if not self.documents:
@@ -627,6 +1056,7 @@ class HybridLocator:
                     self.reranker = None
                     self.deep_mode = False
                     self.doc_embeddings = None
+                    self.doc_embedding_scales = None
                     print("No searchable pages found in the selected directory.")
                     return
                 self.bm25 = BM25Retriever(self.documents)
@@ -636,37 +1066,43 @@ class HybridLocator:
                     self.reranker = None
                     print("Running in keywords-only mode (no semantic reranking)")
                 return
-        else:
-            # Build fresh index
-            print("Building index from PDFs...")
-            self.indexer = PDFIndexer(self.pdf_dir, ocr_mode=ocr_mode,
-                                      ocr_progress_callback=ocr_progress_callback,
-                                      ocr_dpi=ocr_dpi, cancel_event=cancel_event)
-            self.documents = self.indexer.extract_all()
 
-            if cancel_event is not None and cancel_event.is_set():
-                # Ensure no partial cache is left behind
-                if cache_path.exists():
-                    try:
-                        cache_path.unlink()
-                    except Exception:
-                        pass
-                if meta_path.exists():
-                    try:
-                        meta_path.unlink()
-                    except Exception:
-                        pass
-                raise RuntimeError("Indexing canceled")
-            
-            # Cache for next time
-            with open(cache_path, 'wb') as f:
-                pickle.dump(self.documents, f)
+        # Build fresh index
+        print("Building index from PDFs...")
+        self.indexer = PDFIndexer(self.pdf_dir, ocr_mode=ocr_mode,
+                                  ocr_progress_callback=ocr_progress_callback,
+                                  ocr_dpi=ocr_dpi, cancel_event=cancel_event)
+        self.documents = self.indexer.extract_all()
+
+        if cancel_event is not None and cancel_event.is_set():
+            # Ensure no partial cache is left behind
+            if cache_path.exists():
+                try:
+                    cache_path.unlink()
+                except Exception:
+                    pass
+            if meta_path.exists():
+                try:
+                    meta_path.unlink()
+                except Exception:
+                    pass
+            raise RuntimeError("Indexing canceled")
+        
+        # Cache for next time
+        _save_documents(cache_path, self.documents)
+        legacy_path = cache_path.with_suffix(".pkl")
+        if legacy_path.exists():
             try:
-                meta = {"dir_hash": _compute_pdf_dir_hash(self.pdf_dir)}
-                meta_path.write_text(json.dumps(meta), encoding="utf-8")
+                legacy_path.unlink()
             except Exception:
                 pass
-            print("Index cached for future use")
+        try:
+            meta = {"dir_hash": _compute_pdf_dir_hash(self.pdf_dir),
+                    "version": _INDEX_CACHE_VERSION}
+            meta_path.write_text(json.dumps(meta), encoding="utf-8")
+        except Exception:
+            pass
+        print("Index cached for future use")
         
         # If nothing was indexed, leave retrievers unset.
         if not self.documents:
@@ -674,6 +1110,7 @@ class HybridLocator:
             self.reranker = None
             self.deep_mode = False
             self.doc_embeddings = None
+            self.doc_embedding_scales = None
             print("No searchable pages found in the selected directory.")
             return
 
@@ -706,29 +1143,61 @@ class HybridLocator:
         # Prepare texts (truncate long pages)
         texts = [doc.text[:2000] for doc in self.documents]
         
+        # Reuse embeddings of unchanged passages from the disk cache
+        keys = [hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest() for text in texts]
+        cache_path = _embedding_cache_path(self.pdf_dir, self.model_name)
+        cached_keys, cached_rows, cached_scales = _load_embedding_cache(cache_path)
+        if cached_keys == keys:
+            # Unchanged documents: search straight from the mapped cache file
+            self.doc_embeddings = cached_rows
+            self.doc_embedding_scales = cached_scales
+            print(f"  Reusing {total} cached embeddings")
+            if progress_callback:
+                progress_callback(total, total)
+            self.deep_mode = True
+            self._passage_embeddings = {}
+            print("Embeddings computed and ready!")
+            return
+        
+        embeddings = {key: (cached_rows[i], cached_scales[i]) for i, key in enumerate(cached_keys)}
+        missing = [i for i, key in enumerate(keys) if key not in embeddings]
+        reused = total - len(missing)
+        if reused:
+            print(f"  Reusing {reused} cached embeddings")
+        
         # Encode in batches to show progress
         batch_size = 10
-        all_embeddings = []
         
-        for i in range(0, total, batch_size):
+        for start in range(0, len(missing), batch_size):
             if cancel_event is not None and cancel_event.is_set():
                 self.doc_embeddings = None
+                self.doc_embedding_scales = None
                 self.deep_mode = False
                 raise RuntimeError("Indexing canceled")
-            batch_texts = texts[i:i+batch_size]
-            batch_embeddings = self.reranker.encode(batch_texts, is_query=False)
-            all_embeddings.append(batch_embeddings)
+            batch = missing[start:start + batch_size]
+            batch_embeddings = self.reranker.encode([texts[i] for i in batch], is_query=False,
+                                                    normalize=True)
+            # Unit rows make deep-search cosine a dot product; int8 rows cut
+            # memory 4x with ~1e-3 scoring error, well below ranking noise.
+            rows, scales = _quantize_rows(batch_embeddings.astype(np.float32))
+            for i, row, scale in zip(batch, rows, scales):
+                embeddings[keys[i]] = (row, scale)
             
             # Report progress
-            current = min(i + batch_size, total)
+            current = reused + min(start + batch_size, len(missing))
             if progress_callback:
                 progress_callback(current, total)
             print(f"  Processed {current}/{total} pages...")
+        if not missing and progress_callback:
+            progress_callback(total, total)
         
-        # Combine all embeddings
-        import numpy as np
-        self.doc_embeddings = np.vstack(all_embeddings)
+        self.doc_embeddings = np.stack([embeddings[key][0] for key in keys])
+        self.doc_embedding_scales = np.array([embeddings[key][1] for key in keys], dtype=np.float32)
+        # Drop the mapped rows first: Windows can't overwrite a mapped file
+        embeddings = cached_rows = None
+        _save_embedding_cache(cache_path, keys, self.doc_embeddings, self.doc_embedding_scales)
         self.deep_mode = True
+        self._passage_embeddings = {}
         print("Embeddings computed and ready!")
         
     def search(self, query: str, top_k: int = 5, bm25_candidates: int = 20,
@@ -766,48 +1235,75 @@ class HybridLocator:
         
         # Fast mode: BM25 filtering + semantic reranking
         # Stage 1: BM25 retrieval
-        candidates = self.bm25.search(query, top_k=bm25_candidates)
+        hits = self.bm25.search_indices(query, top_k=bm25_candidates)
         
         # If BM25 finds nothing and using multilingual model, do pure semantic search
         # This enables cross-lingual search (e.g., Chinese query → English docs)
         # Only for multilingual model - English models would give garbage results
-        if not candidates and self.reranker and is_multilingual_model:
+        if not hits and self.reranker and is_multilingual_model:
             # Use all documents as candidates for semantic search
-            all_candidates = [(doc, 0.0) for doc in self.documents]
-            # Sample if too many (for performance)
-            if len(all_candidates) > 100:
+            indices = range(len(self.documents))
+            # Sample if too many (for performance). A fixed seed keeps the
+            # sample stable across queries, so its embeddings are encoded once.
+            if len(indices) > 100:
                 import random
-                all_candidates = random.sample(all_candidates, 100)
-            candidates = all_candidates
+                indices = random.Random(0).sample(indices, 100)
+            hits = [(idx, 0.0) for idx in indices]
             bm25_weight = 0.0  # Pure semantic search
             is_cross_lingual = True
         
-        if not candidates:
+        if not hits:
             return [], False
+        candidates = [(self.documents[idx], score) for idx, score in hits]
         
         # Stage 2: Semantic reranking (if model available)
-        if self.reranker:
+        if self.reranker and self._bm25_dominates(hits, bm25_weight, fusion_method):
+            # Reranking would almost never unseat the top hit; keep BM25's order
+            bm25_norm = _percentile_normalize(np.array([score for _, score in hits], dtype=float))
+            results = [(doc, float(norm)) for (doc, _), norm in zip(candidates[:top_k], bm25_norm)]
+        elif self.reranker:
+            candidate_embeddings = self._candidate_embeddings([idx for idx, _ in hits])
             results = self.reranker.rerank(query, candidates, top_k=top_k, 
-                                           bm25_weight=bm25_weight, fusion_method=fusion_method)
+                                           bm25_weight=bm25_weight, fusion_method=fusion_method,
+                                           candidate_embeddings=candidate_embeddings)
         else:
             # BM25 only mode - just take top_k from BM25 results
             results = candidates[:top_k]
         
-        # Format output
+        return self._format_results(query, results), is_cross_lingual
+    
+    def _format_results(self, query: str,
+                        results: list[tuple[PageDocument, Optional[float]]]) -> list[dict]:
+        """Build the result dicts, extracting all snippets in one batch."""
+        snippets = self._extract_snippets([doc.text for doc, _ in results], query)
         output = []
-        for doc, score in results:
-            # Extract a relevant snippet
-            snippet = self._extract_snippet(doc.text, query)
-            score_val = None if score is None else round(score, 3)
+        for (doc, score), snippet in zip(results, snippets):
             output.append({
                 'pdf_name': doc.pdf_name,
                 'page_num': doc.page_num,
                 'chunk_id': doc.chunk_id,
-                'score': score_val,
+                'score': None if score is None else round(score, 3),
                 'snippet': snippet
             })
-        
-        return output, is_cross_lingual
+        return output
+    
+    def _bm25_dominates(self, hits: list[tuple[int, float]], bm25_weight: float,
+                        fusion_method: str) -> bool:
+        """Whether the BM25 ranking is sharp enough to skip semantic reranking."""
+        if fusion_method == "rrf" or bm25_weight < self._BM25_DOMINANCE_MIN_WEIGHT:
+            return False
+        if len(hits) < 2:
+            return True  # Nothing to reorder
+        return hits[0][1] > self._BM25_DOMINANCE_RATIO * hits[1][1]
+    
+    def _candidate_embeddings(self, indices: list[int]) -> np.ndarray:
+        """Passage embeddings for the given documents, encoding each document at most once."""
+        missing = [idx for idx in indices if idx not in self._passage_embeddings]
+        if missing:
+            texts = [self.documents[idx].text[:2000] for idx in missing]
+            embeddings = self.reranker.encode(texts, is_query=False, normalize=True)
+            self._passage_embeddings.update(zip(missing, embeddings))
+        return np.stack([self._passage_embeddings[idx] for idx in indices])
     
     def _search_deep(self, query: str, top_k: int, bm25_weight: float, 
                      is_multilingual: bool, fusion_method: str = "rrf") -> tuple[list[dict], bool]:
@@ -815,7 +1311,7 @@ class HybridLocator:
         is_cross_lingual = False
         
         # Get BM25 scores for all documents
-        query_tokens = tokenize(query)
+        query_tokens = _tokenize_query(query)
         bm25_scores = np.array(self.bm25.bm25.get_scores(query_tokens))
         
         # Check if BM25 found anything (for cross-lingual detection)
@@ -825,55 +1321,54 @@ class HybridLocator:
         
         bm25_scores = bm25_scores.astype(float)
         
-        # Compute semantic scores using pre-computed embeddings
-        query_embedding = self.reranker.encode_single(query, is_query=True)
-        semantic_scores = cosine_similarity(query_embedding, self.doc_embeddings).astype(float)
+        # Compute semantic scores using pre-computed embeddings. Rows were
+        # unit-normalized in precompute_embeddings, so cosine is a dot product.
+        # The query is quantized like the rows and the int8 dot products are
+        # computed exactly, then rescaled.
+        query_embedding = self.reranker.encode_single(query, is_query=True, normalize=True)
+        q_int8, q_scale = _quantize_rows(query_embedding[None, :])
+        raw = _int8_matvec(self.doc_embeddings, q_int8[0])
+        semantic_scores = raw * (self.doc_embedding_scales.astype(float) * float(q_scale[0]))
 
         if fusion_method == "rrf":
-            k = 60.0
-            sem_rank = np.argsort(semantic_scores)[::-1]
-            bm_rank = np.argsort(bm25_scores)[::-1]
-            sem_pos = np.empty_like(sem_rank)
-            bm_pos = np.empty_like(bm_rank)
-            sem_pos[sem_rank] = np.arange(1, len(sem_rank) + 1)
-            bm_pos[bm_rank] = np.arange(1, len(bm_rank) + 1)
-            combined_scores = (1.0 / (k + sem_pos)) + (1.0 / (k + bm_pos))
+            # Reciprocal Rank Fusion (RRF)
+            combined_scores = _rrf_fuse(semantic_scores, bm25_scores)
         else:
-            bm25_scores = _percentile_normalize(bm25_scores)
-            semantic_scores = _percentile_normalize(semantic_scores)
-            combined_scores = (1 - bm25_weight) * semantic_scores + bm25_weight * bm25_scores
+            combined_scores = _blend_scores(semantic_scores, bm25_scores, bm25_weight)
         
         # Get top results
-        top_indices = np.argsort(combined_scores)[::-1][:top_k]
+        top_indices = _top_k_desc(combined_scores, top_k)
         
-        # Format output
-        output = []
-        for idx in top_indices:
-            doc = self.documents[idx]
-            snippet = self._extract_snippet(doc.text, query)
-            score = None if fusion_method == "rrf" else round(float(combined_scores[idx]), 3)
-            output.append({
-                'pdf_name': doc.pdf_name,
-                'page_num': doc.page_num,
-                'chunk_id': doc.chunk_id,
-                'score': score,
-                'snippet': snippet
-            })
-        
-        return output, is_cross_lingual
+        results = [(self.documents[idx],
+                    None if fusion_method == "rrf" else float(combined_scores[idx]))
+                   for idx in top_indices]
+        return self._format_results(query, results), is_cross_lingual
+    
+    @staticmethod
+    def _snippet_pattern(query: str) -> Optional[re.Pattern]:
+        """Compile the query terms into one case-insensitive alternation."""
+        query_terms = _tokenize_query(query)
+        if not query_terms:
+            return None
+        alternation = "|".join(re.escape(term) for term in dict.fromkeys(query_terms))
+        return re.compile(alternation, re.IGNORECASE)
     
-    def _extract_snippet(self, text: str, query: str, max_len: int = 200) -> str:
-        """Extract a relevant snippet from the page text."""
-        # Try to find query terms in text
-        query_terms = tokenize(query)
-        text_lower = text.lower()
+    def _extract_snippets(self, texts: list[str], query: str) -> list[str]:
+        """Snippets for several page texts, sharing one compiled query pattern."""
+        pattern = self._snippet_pattern(query)
+        return [self._extract_snippet(text, pattern) for text in texts]
+    
+    def _extract_snippet(self, text: str, pattern: Optional[re.Pattern], max_len: int = 200) -> str:
+        """Extract a relevant snippet from the page text.
         
+        `pattern` comes from _snippet_pattern and is shared by all results of
+        a search; the snippet is centred on its earliest match.
+        """
         best_pos = 0
-        for term in query_terms:
-            pos = text_lower.find(term)
-            if pos != -1:
-                best_pos = pos
-                break
+        if pattern is not None:
+            match = pattern.search(text)
+            if match:
+                best_pos = match.start()
         
         # Extract snippet around best position
         start = max(0, best_pos - 50)
@@ -5,8 +5,50 @@ Supports Windows (SumatraPDF, Adobe), macOS (Preview), and Linux (evince, okular
 
 import sys
 import os
-import subprocess
-import platform
+import signal
+import threading
+
+# subprocess is only imported where it is needed, keeping it off the
+# startup path (this module is imported while the splash is showing)
+_IS_WINDOWS = sys.platform.startswith("win")
+_IS_MAC = sys.platform == "darwin"
+
+
+# Viewer processes started with posix_spawn; reaped on later launches so
+# closed viewers don't linger as zombies. A set with discard() so reaping
+# the same pid twice is harmless.
+_spawned_pids = set()
+
+# Signals Python ignores at startup; reset to default in the viewer, as
+# Popen(restore_signals=True) does
+_RESTORED_SIGNALS = tuple(getattr(signal, name) for name in ("SIGPIPE", "SIGXFSZ")
+                          if hasattr(signal, name))
+
+
+def _spawn(cmd: list):
+    """Launch a viewer without waiting on it or wiring up pipes.
+    
+    Raises FileNotFoundError (OSError on Windows) if the program is missing.
+    """
+    if _IS_WINDOWS:
+        import subprocess
+        # ShellExecuteEx directly instead of Popen's CreateProcess setup
+        os.startfile(cmd[0], arguments=subprocess.list2cmdline(cmd[1:]))
+        return
+    
+    for pid in list(_spawned_pids):
+        try:
+            if os.waitpid(pid, os.WNOHANG)[0]:
+                _spawned_pids.discard(pid)
+        except ChildProcessError:
+            _spawned_pids.discard(pid)
+    try:
+        _spawned_pids.add(os.posix_spawnp(cmd[0], cmd, os.environ, setsigdef=_RESTORED_SIGNALS))
+    except FileNotFoundError:
+        raise
+    except OSError:
+        import subprocess
+        subprocess.Popen(cmd)
 
 
 def get_app_dir():
@@ -17,65 +59,138 @@ def get_app_dir():
         return os.path.dirname(os.path.abspath(__file__))
 
 
+# Windows viewers in order of preference: bundled SumatraPDF (relative to the
+# app directory), installed SumatraPDF, then Adobe
+_BUNDLED_VIEWERS = (
+    ("_internal\\SumatraPDF\\SumatraPDF.exe", "sumatra"),
+    ("_internal\\SumatraPDF.exe", "sumatra"),
+    ("SumatraPDF\\SumatraPDF.exe", "sumatra"),
+    ("SumatraPDF.exe", "sumatra"),
+)
+_INSTALLED_VIEWERS = (
+    (r"C:\Program Files\SumatraPDF\SumatraPDF.exe", "sumatra"),
+    (r"C:\Program Files (x86)\SumatraPDF\SumatraPDF.exe", "sumatra"),
+    (r"%LOCALAPPDATA%\SumatraPDF\SumatraPDF.exe", "sumatra"),
+    (r"C:\Program Files\Adobe\Acrobat DC\Acrobat\Acrobat.exe", "adobe"),
+    (r"C:\Program Files (x86)\Adobe\Acrobat Reader DC\Reader\AcroRd32.exe", "adobe"),
+    (r"C:\Program Files\Adobe\Acrobat Reader DC\Reader\AcroRd32.exe", "adobe"),
+)
+# Command line for each viewer kind: (exe, pdf_path, page_num) -> argv
+_WINDOWS_VIEWER_ARGS = {
+    "sumatra": lambda exe, pdf_path, page_num: [exe, "-page", str(page_num), pdf_path],
+    "adobe": lambda exe, pdf_path, page_num: [exe, "/A", f"page={page_num}", pdf_path],
+}
+
+# Resolved once per process: (viewer exe, "sumatra" | "adobe"), or ("", "") if none
+_windows_viewer = None
+
+
+def _resolve_windows_viewer() -> tuple:
+    """Find the preferred Windows PDF viewer, probing the filesystem only once."""
+    global _windows_viewer
+    if _windows_viewer is not None:
+        return _windows_viewer
+    
+    app_dir = get_app_dir()
+    candidates = [(app_dir + "\\" + rel_path, kind) for rel_path, kind in _BUNDLED_VIEWERS]
+    candidates += [(os.path.expandvars(path), kind) for path, kind in _INSTALLED_VIEWERS]
+    _windows_viewer = next(((path, kind) for path, kind in candidates if os.path.exists(path)),
+                           ("", ""))
+    return _windows_viewer
+
+
+# Opens a PDF in Preview and jumps to a page; arguments arrive via argv so
+# the script text never changes and paths need no escaping
+_PREVIEW_SCRIPT = '''
+on run {pdfPath, pageNum}
+    tell application "Preview"
+        open POSIX file pdfPath
+        activate
+    end tell
+    delay 0.5
+    tell application "System Events"
+        keystroke "g" using {option down, command down}
+        delay 0.2
+        keystroke pageNum
+        keystroke return
+    end tell
+end run
+'''
+# Bump when _PREVIEW_SCRIPT changes so a stale compiled copy isn't reused
+_PREVIEW_SCRIPT_VERSION = 1
+
+# Path of the compiled script, "" if compiling failed, None if not tried yet
+_compiled_script = None
+_compiled_script_lock = threading.Lock()
+
+
+def _compiled_preview_script() -> str:
+    """Compile _PREVIEW_SCRIPT once with osacompile so osascript skips parsing it per launch."""
+    global _compiled_script
+    with _compiled_script_lock:
+        if _compiled_script is None:
+            _compiled_script = _prepare_preview_script()
+        return _compiled_script
+
+
+def _prepare_preview_script() -> str:
+    """Path of a usable compiled preview script, compiling it if needed; "" on failure."""
+    import subprocess
+    path = os.path.join(os.path.expanduser("~"), "Library", "Caches", "Locus",
+                        f"open_at_page_v{_PREVIEW_SCRIPT_VERSION}.scpt")
+    if os.path.exists(path):
+        # A copy left by an earlier session; make sure it still loads
+        try:
+            subprocess.run(["osadecompile", path], check=True, capture_output=True)
+            return path
+        except (OSError, subprocess.CalledProcessError):
+            _remove_quietly(path)
+    
+    # Compile next to the final path and swap it in, so an interrupted
+    # compile never leaves a half-written script behind
+    tmp_path = f"{path[:-len('.scpt')]}.{os.getpid()}.tmp.scpt"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        subprocess.run(["osacompile", "-o", tmp_path, "-e", _PREVIEW_SCRIPT],
+                       check=True, capture_output=True)
+        os.replace(tmp_path, path)
+    except (OSError, subprocess.CalledProcessError):
+        _remove_quietly(tmp_path)
+        return ""
+    return path
+
+
+def _remove_quietly(path: str):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
 def open_pdf_at_page(pdf_path: str, page_num: int):
     """Open PDF at specific page using bundled or system PDF viewer."""
-    system = platform.system()
+    global _windows_viewer
     pdf_path = os.path.abspath(pdf_path)
     
-    if system == "Windows":
-        app_dir = get_app_dir()
-        bundled_sumatra_paths = [
-            os.path.join(app_dir, "_internal", "SumatraPDF", "SumatraPDF.exe"),
-            os.path.join(app_dir, "_internal", "SumatraPDF.exe"),
-            os.path.join(app_dir, "SumatraPDF", "SumatraPDF.exe"),
-            os.path.join(app_dir, "SumatraPDF.exe"),
-        ]
-        
-        for sumatra in bundled_sumatra_paths:
-            if os.path.exists(sumatra):
-                subprocess.Popen([sumatra, "-page", str(page_num), pdf_path])
-                return True
-        
-        sumatra_paths = [
-            r"C:\Program Files\SumatraPDF\SumatraPDF.exe",
-            r"C:\Program Files (x86)\SumatraPDF\SumatraPDF.exe",
-            os.path.expandvars(r"%LOCALAPPDATA%\SumatraPDF\SumatraPDF.exe"),
-        ]
-        
-        for sumatra in sumatra_paths:
-            if os.path.exists(sumatra):
-                subprocess.Popen([sumatra, "-page", str(page_num), pdf_path])
-                return True
-        
-        adobe_paths = [
-            r"C:\Program Files\Adobe\Acrobat DC\Acrobat\Acrobat.exe",
-            r"C:\Program Files (x86)\Adobe\Acrobat Reader DC\Reader\AcroRd32.exe",
-            r"C:\Program Files\Adobe\Acrobat Reader DC\Reader\AcroRd32.exe",
-        ]
-        
-        for adobe in adobe_paths:
-            if os.path.exists(adobe):
-                subprocess.Popen([adobe, "/A", f"page={page_num}", pdf_path])
+    if _IS_WINDOWS:
+        viewer, kind = _resolve_windows_viewer()
+        if kind:
+            try:
+                _spawn(_WINDOWS_VIEWER_ARGS[kind](viewer, pdf_path, page_num))
                 return True
+            except OSError:
+                # Viewer was removed since it was found; look again next time
+                _windows_viewer = None
         
         os.startfile(pdf_path)
         return False
         
-    elif system == "Darwin":
-        script = f'''
-        tell application "Preview"
-            open POSIX file "{pdf_path}"
-            activate
-        end tell
-        delay 0.5
-        tell application "System Events"
-            keystroke "g" using {{option down, command down}}
-            delay 0.2
-            keystroke "{page_num}"
-            keystroke return
-        end tell
-        '''
-        subprocess.Popen(["osascript", "-e", script])
+    elif _IS_MAC:
+        compiled = _compiled_preview_script()
+        if compiled:
+            _spawn(["osascript", compiled, pdf_path, str(page_num)])
+        else:
+            _spawn(["osascript", "-e", _PREVIEW_SCRIPT, pdf_path, str(page_num)])
         return True
         
     else:
@@ -87,7 +202,7 @@ def open_pdf_at_page(pdf_path: str, page_num: int):
         
         for cmd, name in viewers:
             try:
-                subprocess.Popen(cmd)
+                _spawn(cmd)
                 return name != "xdg-open"
             except FileNotFoundError:
                 continue
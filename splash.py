@@ -92,20 +92,40 @@ class SplashScreen:
                                  bg="#1a1a2e", fg="#444455")
         version_label.pack(side="bottom", pady=(15, 5))
         
-        self.root.update()
+        # One geometry pass over the finished layout; the window is mapped and
+        # drawn by the event loop in wait_for(), so no full update() is needed
+        self.root.update_idletasks()
     
     def set_progress(self, percent):
         """Set progress bar to specific percentage."""
         width = int(self.bar_max * percent / 100)
         self.bar_fill.configure(width=width)
-        self.root.update()
+        # Redraw only; a full update() would also run queued events and
+        # callbacks in the middle of startup loading
+        self.root.update_idletasks()
     
     def set_status(self, text, percent=None):
         """Update status text and optionally progress."""
         self.status_var.set(text)
         if percent is not None:
             self.set_progress(percent)
-        self.root.update()
+        else:
+            self.root.update_idletasks()
+    
+    def schedule_status(self, text, percent=None):
+        """Thread-safe set_status: runs on the Tk thread via after()."""
+        self.root.after(0, self.set_status, text, percent)
+    
+    def wait_for(self, done, poll_ms=50):
+        """Run the splash event loop until the threading.Event `done` is set."""
+        def poll():
+            if done.is_set():
+                self.root.quit()
+            else:
+                self.root.after(poll_ms, poll)
+        
+        self.root.after(poll_ms, poll)
+        self.root.mainloop()
     
     def close(self):
         """Close splash screen."""
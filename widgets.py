@@ -2,13 +2,27 @@
 Custom widget components for the Locus GUI.
 """
 
+from functools import lru_cache
+import tkinter as tk
+
 import customtkinter as ctk
 from fonts import ui_font
-from i18n import t
+from i18n import t, get_lang
+
+
+@lru_cache(maxsize=1024)
+def _format_snippet(snippet: str) -> str:
+    """Truncated, whitespace-collapsed snippet preview (re-rendered results hit the cache)."""
+    snippet_short = snippet[:120] + "..." if len(snippet) > 120 else snippet
+    return ' '.join(snippet_short.split())
 
 
 class ResultCard(ctk.CTkFrame):
     """A single result card with modern styling."""
+    # Bind tag shared by every widget inside every card; the click handlers
+    # are bound to it once per app instead of on each widget.
+    _CLICK_TAG = "ResultCardClick"
+    _click_tag_bound = False
     
     def __init__(self, parent, rank, pdf_name, page_num, chunk_id, score, snippet, on_click, on_double_click):
         super().__init__(parent, corner_radius=8, fg_color=("gray90", "gray20"))
@@ -20,53 +34,108 @@ class ResultCard(ctk.CTkFrame):
         self.on_click = on_click
         self.on_double_click = on_double_click
         self.selected = False
+        self._font_lang = get_lang()
         
         self.grid_columnconfigure(1, weight=1)
         
         # Rank badge
-        rank_label = ctk.CTkLabel(self, text=f"#{rank}", font=ui_font(11, bold=True),
-                                   width=30, fg_color=("gray80", "gray30"), corner_radius=5)
-        rank_label.grid(row=0, column=0, rowspan=2, padx=(8, 8), pady=8)
+        self.rank_label = ctk.CTkLabel(self, text=f"#{rank}", font=ui_font(11, bold=True),
+                                       width=30, fg_color=("gray80", "gray30"), corner_radius=5)
+        self.rank_label.grid(row=0, column=0, rowspan=2, padx=(8, 8), pady=8)
         
         # PDF name and page
         header_frame = ctk.CTkFrame(self, fg_color="transparent")
         header_frame.grid(row=0, column=1, sticky="ew", padx=(0, 8), pady=(8, 2))
-        header_frame.grid_columnconfigure(0, weight=1)
+        header_frame.grid_columnconfigure(1, weight=1)
         
-        info_frame = ctk.CTkFrame(header_frame, fg_color="transparent")
-        info_frame.pack(side="left", fill="x", expand=True)
+        self.name_label = ctk.CTkLabel(header_frame, text=pdf_name, font=ui_font(11, bold=True),
+                                       anchor="w")
+        self.name_label.grid(row=0, column=0, sticky="w")
         
-        ctk.CTkLabel(info_frame, text=pdf_name, font=ui_font(11, bold=True),
-                     anchor="w").pack(side="left")
-        
-        page_text = t("results.page", num=page_num)
-        if chunk_id:
-            page_text = f"{page_text} · {t('results.chunk', num=chunk_id)}"
-        ctk.CTkLabel(info_frame, text=f"  📄 {page_text}", font=ui_font(10),
-                     text_color="gray", anchor="w").pack(side="left")
+        self.page_label = ctk.CTkLabel(header_frame, text=self._page_text(page_num, chunk_id),
+                                       font=ui_font(10), text_color="gray", anchor="w")
+        self.page_label.grid(row=0, column=1, sticky="w")
         
-        # Score badge (optional)
+        # Score badge (gridded only when the result has a score)
+        self.score_label = ctk.CTkLabel(header_frame, font=ui_font(9), corner_radius=4,
+                                        text_color="white", padx=6, pady=1,
+                                        **self._score_style(score))
         if score is not None:
-            score_color = "#28a745" if score > 0.7 else "#ffc107" if score > 0.4 else "#6c757d"
-            ctk.CTkLabel(header_frame, text=f"{score:.2f}", font=ui_font(9),
-                         fg_color=score_color, corner_radius=4, text_color="white",
-                         padx=6, pady=1).pack(side="right", padx=(0, 5))
+            self.score_label.grid(row=0, column=2, sticky="e", padx=(0, 5))
         
         # Snippet preview
-        snippet_short = snippet[:120] + "..." if len(snippet) > 120 else snippet
-        snippet_short = ' '.join(snippet_short.split())
-        self.snippet_label = ctk.CTkLabel(self, text=snippet_short, font=ui_font(10),
-                                           anchor="w", justify="left", text_color="gray")
+        self.snippet_label = ctk.CTkLabel(self, text=_format_snippet(snippet), font=ui_font(10),
+                                          anchor="w", justify="left", text_color="gray")
         self.snippet_label.grid(row=1, column=1, sticky="ew", padx=(0, 8), pady=(0, 8))
         
-        # Bind click events to all children
-        self._bind_click_recursive(self)
+        # Route clicks on any part of the card to it
+        if not ResultCard._click_tag_bound:
+            # Plain Tk bind_class, bypassing CTk's bind overrides
+            tk.Misc.bind_class(self, self._CLICK_TAG, "<Button-1>", ResultCard._dispatch_click)
+            tk.Misc.bind_class(self, self._CLICK_TAG, "<Double-Button-1>",
+                               ResultCard._dispatch_double_click)
+            ResultCard._click_tag_bound = True
+        self._add_click_tag(self)
+    
+    @staticmethod
+    def _page_text(page_num, chunk_id):
+        page_text = t("results.page", num=page_num)
+        if chunk_id:
+            page_text = f"{page_text} · {t('results.chunk', num=chunk_id)}"
+        return f"  📄 {page_text}"
+    
+    @staticmethod
+    def _score_style(score):
+        if score is None:
+            return {"text": ""}
+        score_color = "#28a745" if score > 0.7 else "#ffc107" if score > 0.4 else "#6c757d"
+        return {"text": f"{score:.2f}", "fg_color": score_color}
     
-    def _bind_click_recursive(self, widget):
-        widget.bind("<Button-1>", self._handle_click)
-        widget.bind("<Double-Button-1>", self._handle_double_click)
+    def reconfigure(self, rank, pdf_name, page_num, chunk_id, score, snippet):
+        """Show a different result in this pooled card, reusing its widgets."""
+        self.pdf_name = pdf_name
+        self.page_num = page_num
+        self.chunk_id = chunk_id
+        self.snippet = snippet
+        if self.selected:
+            self.set_selected(False)
+        
+        # Fonts only need resetting when the UI language changed since the card was built
+        if self._font_lang != get_lang():
+            self._font_lang = get_lang()
+            self.rank_label.configure(font=ui_font(11, bold=True))
+            self.name_label.configure(font=ui_font(11, bold=True))
+            self.page_label.configure(font=ui_font(10))
+            self.score_label.configure(font=ui_font(9))
+            self.snippet_label.configure(font=ui_font(10))
+        
+        self.rank_label.configure(text=f"#{rank}")
+        self.name_label.configure(text=pdf_name)
+        self.page_label.configure(text=self._page_text(page_num, chunk_id))
+        if score is not None:
+            self.score_label.configure(**self._score_style(score))
+            self.score_label.grid(row=0, column=2, sticky="e", padx=(0, 5))
+        else:
+            self.score_label.grid_remove()
+        self.snippet_label.configure(text=_format_snippet(snippet))
+    
+    def _add_click_tag(self, widget):
+        widget._result_card = self
+        widget.bindtags(widget.bindtags() + (self._CLICK_TAG,))
         for child in widget.winfo_children():
-            self._bind_click_recursive(child)
+            self._add_click_tag(child)
+    
+    @staticmethod
+    def _dispatch_click(event):
+        card = getattr(event.widget, "_result_card", None)
+        if card is not None:
+            card._handle_click(event)
+    
+    @staticmethod
+    def _dispatch_double_click(event):
+        card = getattr(event.widget, "_result_card", None)
+        if card is not None:
+            card._handle_double_click(event)
     
     def _handle_click(self, event):
         self.on_click(self)